@@ -1,8 +1,15 @@
 import json
-import boto3
 import logging
 import os
-from datetime import datetime
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import chain
+from operator import attrgetter
 from botocore.exceptions import ClientError, NoCredentialsError
 
 # Configure logging
@@ -10,8 +17,93 @@ logger = logging.getLogger()
 log_level = os.environ.get('LOG_LEVEL', 'INFO')
 logger.setLevel(getattr(logging, log_level))
 
-# Initialize S3 client
-s3_client = boto3.client('s3')
+_UTC = timezone.utc
+
+# Environment configuration is fixed for the lifetime of a container, read it once
+_BUCKET_NAME = os.environ.get('BUCKET_NAME')
+
+
+def _refresh_config():
+    """
+    Re-read environment configuration, for tests that change it after import
+    """
+    global _BUCKET_NAME
+    _BUCKET_NAME = os.environ.get('BUCKET_NAME')
+
+
+# S3 client, created on first use and reused by every warm invocation of the container
+_s3_client = None
+
+
+def _get_s3():
+    """
+    Return the shared S3 client, importing boto3 and creating it on first use
+
+    Deferring the import keeps boto3 and its service models off the cold start
+    path of invocations that never reach S3.
+
+    Returns:
+        S3 client
+    """
+    global _s3_client
+    if _s3_client is None:
+        import boto3
+        import botocore.config
+
+        _s3_client = boto3.client('s3', config=botocore.config.Config(
+            max_pool_connections=64,
+            tcp_keepalive=True,
+            retries={'max_attempts': 3, 'mode': 'standard'}
+        ))
+    return _s3_client
+
+# Response headers shared by every API Gateway response, treat as read-only
+DEFAULT_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*',  # Enable CORS
+    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
+    'Access-Control-Allow-Methods': 'GET,OPTIONS'
+}
+
+# AWS error code -> (status code, error, message) returned to the API caller
+CLIENT_ERROR_RESPONSES = {
+    'NoSuchBucket': (404, 'Bucket not found', 'The specified bucket does not exist'),
+    'AccessDenied': (403, 'Access denied', 'Insufficient permissions to access the bucket')
+}
+DEFAULT_CLIENT_ERROR_RESPONSE = (500, 'AWS service error', 'An error occurred while accessing AWS services')
+
+# ListObjectsV2 returns at most 1000 keys per page; larger listings are paginated
+S3_PAGE_SIZE = 1000
+MAX_TOTAL_KEYS = int(os.environ.get('MAX_TOTAL_KEYS', 10000))
+PAGE_WORKERS = 10
+SHARD_WORKERS = 32
+
+# In-memory listing cache, kept across warm invocations of the same container.
+# Maps (bucket_name, prefix, max_keys, fetch_all) -> (monotonic timestamp, object count, serialized body).
+# Only the body is kept, and the cache is capped by the total size of the bodies
+CACHE_TTL = float(os.environ.get('CACHE_TTL', 30))
+CACHE_MAX_BYTES = int(os.environ.get('CACHE_MAX_BYTES', 16 * 1024 * 1024))
+_CACHE = {}
+
+
+@dataclass
+class S3ObjectInfo:
+    """Object entry of a listing response, slotted to keep large listings compact"""
+    __slots__ = ('key', 'size', 'last_modified', 'etag', 'storage_class')
+
+    key: str
+    size: int
+    last_modified: int
+    etag: str
+    storage_class: str
+
+
+@dataclass
+class S3OwnedObjectInfo(S3ObjectInfo):
+    """Object entry of a listing made with FetchOwner"""
+    __slots__ = ('owner',)
+
+    owner: dict
 
 def lambda_handler(event, context):
     """
@@ -26,11 +118,11 @@ def lambda_handler(event, context):
     """
 
     # Log the incoming event for debugging
-    logger.info(f"Received event: {json.dumps(event, default=str)}")
+    logger.debug("Received event: %s", event)
 
     try:
         # Get bucket name from environment variable
-        bucket_name = os.environ.get('BUCKET_NAME')
+        bucket_name = _BUCKET_NAME
         if not bucket_name:
             logger.error("BUCKET_NAME environment variable not set")
             return create_response(500, {
@@ -41,43 +133,34 @@ def lambda_handler(event, context):
         # Get query parameters
         query_params = event.get('queryStringParameters') or {}
         prefix = query_params.get('prefix', '')
-        max_keys = int(query_params.get('max_keys', 100))
 
-        # Validate max_keys parameter
-        if max_keys > 1000:
-            max_keys = 1000  # AWS limit
-            logger.warning(f"max_keys reduced to 1000 (AWS limit)")
+        # Parse and clamp max_keys in one pass, skipping int() when it is absent
+        raw_max_keys = query_params.get('max_keys')
+        max_keys = 100 if raw_max_keys is None else min(MAX_TOTAL_KEYS, int(raw_max_keys))
 
-        logger.info(f"Listing objects in bucket: {bucket_name}, prefix: '{prefix}', max_keys: {max_keys}")
+        # fetch_all lists everything up to the configured limit
+        fetch_all = query_params.get('fetch_all', '').lower() == 'true'
+        if fetch_all:
+            max_keys = MAX_TOTAL_KEYS
 
-        # List objects in the bucket
-        response = list_bucket_objects(bucket_name, prefix, max_keys)
+        logger.info("Listing objects in bucket: %s, prefix: '%s', max_keys: %d", bucket_name, prefix, max_keys)
 
-        logger.info(f"Successfully listed {len(response.get('objects', []))} objects")
+        # List objects in the bucket
+        body = list_bucket_objects_to_json(bucket_name, prefix, max_keys, fetch_all)
 
-        return create_response(200, response)
+        return create_response(200, body, body_is_serialized=True)
 
     except ClientError as e:
         error_code = e.response['Error']['Code']
         error_message = e.response['Error']['Message']
 
-        logger.error(f"AWS ClientError: {error_code} - {error_message}")
+        logger.error("AWS ClientError: %s - %s", error_code, error_message)
 
-        if error_code == 'NoSuchBucket':
-            return create_response(404, {
-                'error': 'Bucket not found',
-                'message': f'The specified bucket does not exist'
-            })
-        elif error_code == 'AccessDenied':
-            return create_response(403, {
-                'error': 'Access denied',
-                'message': 'Insufficient permissions to access the bucket'
-            })
-        else:
-            return create_response(500, {
-                'error': 'AWS service error',
-                'message': f'An error occurred while accessing AWS services'
-            })
+        status_code, error, message = CLIENT_ERROR_RESPONSES.get(error_code, DEFAULT_CLIENT_ERROR_RESPONSE)
+        return create_response(status_code, {
+            'error': error,
+            'message': message
+        })
 
     except NoCredentialsError:
         logger.error("AWS credentials not found")
@@ -87,21 +170,21 @@ def lambda_handler(event, context):
         })
 
     except ValueError as e:
-        logger.error(f"Value error: {str(e)}")
+        logger.error("Value error: %s", e)
         return create_response(400, {
             'error': 'Invalid request',
             'message': str(e)
         })
 
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         return create_response(500, {
             'error': 'Internal server error',
             'message': 'An unexpected error occurred'
         })
 
 
-def list_bucket_objects(bucket_name, prefix='', max_keys=100):
+def list_bucket_objects(bucket_name, prefix='', max_keys=100, fetch_all=False):
     """
     List objects in S3 bucket with optional prefix filter
 
@@ -109,10 +192,55 @@ def list_bucket_objects(bucket_name, prefix='', max_keys=100):
         bucket_name (str): Name of the S3 bucket
         prefix (str): Prefix to filter objects
         max_keys (int): Maximum number of objects to return
+        fetch_all (bool): List sub-prefixes concurrently, for very large buckets
 
     Returns:
         dict: Response containing bucket contents and metadata
     """
+    return _list_bucket_objects(bucket_name, prefix, max_keys, fetch_all, serialize=False)[0]
+
+
+def list_bucket_objects_to_json(bucket_name, prefix='', max_keys=100, fetch_all=False):
+    """
+    List objects in S3 bucket and return the response body as JSON
+
+    Bodies of complete listings are cached per container, so a listing is
+    fetched and serialized once however many times it is served.
+
+    Args:
+        bucket_name (str): Name of the S3 bucket
+        prefix (str): Prefix to filter objects
+        max_keys (int): Maximum number of objects to return
+        fetch_all (bool): List sub-prefixes concurrently, for very large buckets
+
+    Returns:
+        str: JSON encoded response body
+    """
+    return _list_bucket_objects(bucket_name, prefix, max_keys, fetch_all, serialize=True)[1]
+
+
+def _list_bucket_objects(bucket_name, prefix, max_keys, fetch_all, serialize):
+    """
+    List objects in S3 bucket, serving and caching JSON bodies when asked for one
+
+    The cache only holds bodies, so it is consulted only when serialize is set.
+
+    Args:
+        bucket_name (str): Name of the S3 bucket
+        prefix (str): Prefix to filter objects
+        max_keys (int): Maximum number of objects to return
+        fetch_all (bool): List sub-prefixes concurrently, for very large buckets
+        serialize (bool): Return the JSON encoded body as well
+
+    Returns:
+        tuple: (result dict or None on a cache hit, JSON body or None when not serialized)
+    """
+    cache_key = (bucket_name, prefix, max_keys, fetch_all)
+    if serialize:
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            logger.info("Serving %d objects from warm container cache", cached[0])
+            return None, cached[1]
 
     try:
         # Prepare list_objects_v2 parameters
@@ -124,35 +252,19 @@ def list_bucket_objects(bucket_name, prefix='', max_keys=100):
         if prefix:
             list_params['Prefix'] = prefix
 
-        # List objects
-        response = s3_client.list_objects_v2(**list_params)
-
-        # Process the response
-        objects = []
-        total_size = 0
-
-        if 'Contents' in response:
-            for obj in response['Contents']:
-                # Convert datetime to string for JSON serialization
-                last_modified = obj['LastModified'].isoformat()
-
-                object_info = {
-                    'key': obj['Key'],
-                    'size': obj['Size'],
-                    'last_modified': last_modified,
-                    'etag': obj['ETag'].strip('"'),  # Remove quotes from ETag
-                    'storage_class': obj.get('StorageClass', 'STANDARD')
-                }
-
-                # Add owner info if available
-                if 'Owner' in obj:
-                    object_info['owner'] = {
-                        'id': obj['Owner'].get('ID'),
-                        'display_name': obj['Owner'].get('DisplayName')
-                    }
+        if fetch_all:
+            # Fan the listing out over the sub-prefixes of the requested prefix
+            objects, response = _list_sharded(list_params)
+        elif max_keys > S3_PAGE_SIZE:
+            # More keys than a single page holds, walk the pages
+            objects, response = _list_all_pages(list_params)
+        else:
+            # List objects
+            response = _get_s3().list_objects_v2(**list_params)
+            objects = _build_page(response.get('Contents', ()), list_params.get('FetchOwner', False))
 
-                objects.append(object_info)
-                total_size += obj['Size']
+        logger.info("Successfully listed %d objects", len(objects))
+        total_size = sum(obj.size for obj in objects)
 
         # Prepare response
         result = {
@@ -163,57 +275,424 @@ def list_bucket_objects(bucket_name, prefix='', max_keys=100):
             'total_size_mb': round(total_size / (1024 * 1024), 2),
             'is_truncated': response.get('IsTruncated', False),
             'objects': objects,
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': time.time_ns() // 1_000_000
         }
 
-        # Add continuation token if results are truncated
-        if response.get('IsTruncated'):
-            result['next_continuation_token'] = response.get('NextContinuationToken')
-            logger.info(f"Results truncated. NextContinuationToken available.")
+        # Add continuation token if results are truncated, sharded listings have none
+        if response.get('IsTruncated') and response.get('NextContinuationToken'):
+            result['next_continuation_token'] = response['NextContinuationToken']
+            logger.info("Results truncated. NextContinuationToken available.")
 
         # Add common prefixes if any (for folder-like structure)
-        if 'CommonPrefixes' in response:
-            result['common_prefixes'] = [cp['Prefix'] for cp in response['CommonPrefixes']]
+        common_prefixes = response.get('CommonPrefixes')
+        if common_prefixes:
+            result['common_prefixes'] = [cp['Prefix'] for cp in common_prefixes]
+
+        if not serialize:
+            return result, None
+
+        body = dumps_json(result)
 
-        return result
+        # Truncated listings are not cached so pagination is never masked
+        if not result['is_truncated']:
+            _cache_put(cache_key, len(objects), body)
+
+        return result, body
 
     except Exception as e:
-        logger.error(f"Error listing bucket objects: {str(e)}")
+        logger.error("Error listing bucket objects: %s", e)
         raise
 
 
-def create_response(status_code, body, headers=None):
+def _list_all_pages(list_params):
+    """
+    List up to MaxKeys objects across several ListObjectsV2 pages
+
+    Pages are fetched sequentially while the objects of already fetched
+    pages are built on a thread pool.
+
+    Args:
+        list_params (dict): list_objects_v2 parameters, MaxKeys is the total limit
+
+    Returns:
+        tuple: (list of S3ObjectInfo records, last ListObjectsV2 page)
+    """
+    fetch_owner = list_params.get('FetchOwner', False)
+    response = {}
+
+    with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as executor:
+        futures = []
+        for response in _iter_pages(list_params):
+            futures.append(executor.submit(_build_page, response.get('Contents', ()), fetch_owner))
+        objects = [obj for future in futures for obj in future.result()]
+
+    # The last page carries S3's own IsTruncated and NextContinuationToken
+    return objects, response
+
+
+def _iter_pages(list_params, first_page_size=S3_PAGE_SIZE):
+    """
+    Yield ListObjectsV2 pages until MaxKeys entries have been listed
+
+    Each request asks for no more than the remaining entries, so the last
+    page ends exactly at the limit and its NextContinuationToken resumes
+    the listing from there.
+
+    Args:
+        list_params (dict): list_objects_v2 parameters, MaxKeys is the total limit
+        first_page_size (int): Maximum number of entries requested by the first page
+
+    Yields:
+        dict: ListObjectsV2 response pages
+    """
+    s3_client = _get_s3()
+    params = dict(list_params)
+    remaining = params.pop('MaxKeys')
+    page_size = first_page_size
+
+    while remaining > 0:
+        response = s3_client.list_objects_v2(MaxKeys=min(page_size, remaining), **params)
+        page_size = S3_PAGE_SIZE
+        yield response
+
+        # MaxKeys counts both objects and rolled up common prefixes
+        remaining -= len(response.get('Contents', ())) + len(response.get('CommonPrefixes', ()))
+        if not response.get('IsTruncated'):
+            break
+        params['ContinuationToken'] = response['NextContinuationToken']
+
+
+def _list_sharded(list_params):
+    """
+    List up to MaxKeys objects by sharding the listing on the '/' delimiter
+
+    A delimited listing of the prefix, bounded to MaxKeys entries, returns
+    its direct objects and its sub-prefixes. Each sub-prefix is paginated on
+    its own thread and the shards are merged back in key order, stopping the
+    remaining shards once the earlier ones fill MaxKeys. A flat prefix has
+    nothing to shard and is listed with _list_all_pages instead.
+
+    Sharded listings are assembled from several S3 listings, so they have no
+    continuation token and cannot be resumed.
+
+    Args:
+        list_params (dict): list_objects_v2 parameters, MaxKeys is the total limit
+
+    Returns:
+        tuple: (list of S3ObjectInfo records, dict with IsTruncated)
+    """
+    params = dict(list_params)
+    max_items = params.pop('MaxKeys')
+    fetch_owner = params.get('FetchOwner', False)
+
+    pages = _iter_pages({**list_params, 'Delimiter': '/'})
+    response = next(pages)
+    if not response.get('CommonPrefixes'):
+        if not response.get('IsTruncated'):
+            return _build_page(response.get('Contents', ()), fetch_owner), response
+        return _list_all_pages(list_params)
+
+    objects = []
+    shard_prefixes = []
+    for response in chain((response,), pages):
+        objects.extend(_build_page(response.get('Contents', ()), fetch_owner))
+        shard_prefixes.extend(cp['Prefix'] for cp in response.get('CommonPrefixes', ()))
+    delimited_truncated = response.get('IsTruncated', False)
+    is_truncated = delimited_truncated
+
+    # The delimited pass has only seen entries up to its last object key or
+    # sub-prefix; when it was cut short nothing past that boundary is complete
+    last_key = objects[-1].key if objects else ''
+    boundary_prefix = shard_prefixes[-1] if shard_prefixes[-1] > last_key else None
+    boundary = boundary_prefix or last_key
+
+    # Shard prefixes are sorted, so the direct objects and the shards before a
+    # shard all sort ahead of it and use up its share of the budget
+    direct_keys = [obj.key for obj in objects]
+    shards = deque(shard_prefixes)
+    in_flight = deque()
+    listed = 0
+    stop = threading.Event()
+
+    with ThreadPoolExecutor(max_workers=SHARD_WORKERS) as executor:
+        try:
+            while True:
+                # Keep the window full, each shard limited to the budget left ahead of it
+                while shards and len(in_flight) < SHARD_WORKERS:
+                    shard_prefix = shards.popleft()
+                    ahead = bisect_left(direct_keys, shard_prefix)
+                    budget = max_items - ahead - listed
+                    if budget <= 0:
+                        is_truncated = True
+                        shards.clear()
+                        break
+
+                    # Split the open budget over the window for the first pages, so the
+                    # read-ahead of shards that end up past the budget stays small
+                    turn = threading.Event()
+                    future = executor.submit(
+                        _list_shard,
+                        {**params, 'Prefix': shard_prefix, 'MaxKeys': budget},
+                        max(1, budget // SHARD_WORKERS),
+                        turn,
+                        stop
+                    )
+                    in_flight.append((future, turn, ahead))
+
+                if not in_flight:
+                    break
+
+                future, turn, ahead = in_flight.popleft()
+                if max_items - ahead - listed <= 0:
+                    # Earlier shards filled the budget, release and stop the rest
+                    is_truncated = True
+                    stop.set()
+                    turn.set()
+                    break
+
+                # The shard at the head of the merge may page past its first page
+                turn.set()
+                shard_objects, shard_truncated = future.result()
+                objects.extend(shard_objects)
+                listed += len(shard_objects)
+                is_truncated = is_truncated or shard_truncated
+        finally:
+            # Release the shards still waiting for their turn, also when a shard
+            # raised, so the executor does not wait on them forever
+            stop.set()
+            for pending_future, pending_turn, _ in in_flight:
+                pending_future.cancel()
+                pending_turn.set()
+
+    objects.sort(key=attrgetter('key'))
+    if len(objects) > max_items:
+        is_truncated = True
+        del objects[max_items:]
+
+    if delimited_truncated:
+        while objects and objects[-1].key > boundary and not (
+                boundary_prefix and objects[-1].key.startswith(boundary_prefix)):
+            objects.pop()
+
+    return objects, {'IsTruncated': is_truncated}
+
+
+def _list_shard(params, first_page_size, turn, stop):
+    """
+    Paginate one sub-prefix of a sharded listing
+
+    The first page is fetched straight away, later pages only once the shard
+    reaches the head of the merge, so shards that end up past the budget
+    fetch at most one page.
+
+    Args:
+        params (dict): list_objects_v2 parameters for the shard, MaxKeys is the shard budget
+        first_page_size (int): Maximum number of keys fetched ahead of the shard's turn
+        turn (threading.Event): Set once the shard is at the head of the merge
+        stop (threading.Event): Set once the shard is no longer needed
+
+    Returns:
+        tuple: (list of S3ObjectInfo records, whether the shard was truncated)
+    """
+    fetch_owner = params.get('FetchOwner', False)
+    objects = []
+    response = {}
+
+    for response in _iter_pages(params, first_page_size):
+        objects.extend(_build_page(response.get('Contents', ()), fetch_owner))
+        # A shard that used up its budget has no further pages to wait for
+        if response.get('IsTruncated') and len(objects) < params['MaxKeys']:
+            turn.wait()
+            if stop.is_set():
+                break
+
+    return objects, response.get('IsTruncated', False)
+
+
+def _build_page(contents, fetch_owner=False):
+    """
+    Build the object info list for one ListObjectsV2 page
+
+    Args:
+        contents (list): Contents list of the page
+        fetch_owner (bool): Whether the listing was made with FetchOwner
+
+    Returns:
+        list: S3ObjectInfo records
+    """
+    # Pick the builder once and bind it locally for the hot loop
+    build = _build_obj_with_owner if fetch_owner else _build_obj_basic
+    return [build(obj) for obj in contents]
+
+
+def _build_obj_basic(obj):
+    """
+    Convert a ListObjectsV2 content entry into the response object format
+
+    Args:
+        obj (dict): Entry from the ListObjectsV2 Contents list
+
+    Returns:
+        S3ObjectInfo: Object info for the response body
+    """
+    return S3ObjectInfo(
+        obj['Key'],
+        obj['Size'],
+        # Epoch milliseconds, cheaper to produce than an ISO string
+        int(obj['LastModified'].timestamp() * 1000),
+        obj['ETag'].strip('"'),  # Remove quotes from ETag
+        obj['StorageClass'] if 'StorageClass' in obj else 'STANDARD'
+    )
+
+
+def _build_obj_with_owner(obj):
+    """
+    Convert a ListObjectsV2 content entry listed with FetchOwner, including owner info
+
+    Args:
+        obj (dict): Entry from the ListObjectsV2 Contents list
+
+    Returns:
+        S3ObjectInfo: Object info for the response body
+    """
+    # Add owner info if available
+    if 'Owner' not in obj:
+        return _build_obj_basic(obj)
+
+    owner = obj['Owner']
+    return S3OwnedObjectInfo(
+        obj['Key'],
+        obj['Size'],
+        int(obj['LastModified'].timestamp() * 1000),
+        obj['ETag'].strip('"'),
+        obj['StorageClass'] if 'StorageClass' in obj else 'STANDARD',
+        {
+            'id': owner.get('ID'),
+            'display_name': owner.get('DisplayName')
+        }
+    )
+
+
+def _cache_get(key):
+    """
+    Return the serialized body of a cached listing if it is still fresh
+
+    Args:
+        key (tuple): Cache key (bucket_name, prefix, max_keys, fetch_all)
+
+    Returns:
+        tuple: (object count, JSON body), or None on a miss
+    """
+    entry = _CACHE.get(key)
+    if entry is None:
+        return None
+
+    cached_at, object_count, body = entry
+    if time.monotonic() - cached_at >= CACHE_TTL:
+        del _CACHE[key]
+        return None
+
+    return object_count, body
+
+
+def _cache_put(key, object_count, body):
+    """
+    Store a listing body in the cache, evicting the oldest entries past CACHE_MAX_BYTES
+
+    Body sizes are counted in characters, which match bytes since json.dumps
+    escapes non-ASCII characters.
+
+    Args:
+        key (tuple): Cache key (bucket_name, prefix, max_keys, fetch_all)
+        object_count (int): Number of objects in the listing
+        body (str): JSON encoded response body
+    """
+    if CACHE_TTL <= 0 or len(body) > CACHE_MAX_BYTES:
+        return
+
+    _CACHE.pop(key, None)
+    _CACHE[key] = (time.monotonic(), object_count, body)
+
+    # dicts preserve insertion order, so the first key is the oldest entry
+    cached_bytes = sum(len(entry[2]) for entry in _CACHE.values())
+    while cached_bytes > CACHE_MAX_BYTES:
+        cached_bytes -= len(_CACHE.pop(next(iter(_CACHE)))[2])
+
+
+def create_response(status_code, body, headers=None, body_is_serialized=False):
     """
     Create API Gateway response object
 
     Args:
         status_code (int): HTTP status code
-        body (dict): Response body
+        body (dict): Response body, or a JSON string when body_is_serialized is set
         headers (dict): Optional headers
+        body_is_serialized (bool): Whether body is already JSON encoded
 
     Returns:
         dict: API Gateway response object
     """
 
-    default_headers = {
-        'Content-Type': 'application/json',
-        'Access-Control-Allow-Origin': '*',  # Enable CORS
-        'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
-        'Access-Control-Allow-Methods': 'GET,OPTIONS'
-    }
-
-    if headers:
-        default_headers.update(headers)
-
     response = {
         'statusCode': status_code,
-        'headers': default_headers,
-        'body': json.dumps(body, default=str)
+        'headers': {**DEFAULT_HEADERS, **headers} if headers else DEFAULT_HEADERS,
+        'body': body if body_is_serialized else dumps_json(body)
     }
 
     return response
 
 
+def dumps_json(obj):
+    """
+    Serialize an object to a compact JSON string, encoding S3ObjectInfo records as objects
+
+    The stdlib encoder is the only path, so records go through _json_default
+    and the separators drop the whitespace json.dumps adds by default.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        str: JSON encoded string
+    """
+    return json.dumps(obj, separators=(',', ':'), default=_json_default)
+
+
+def _json_default(obj):
+    """
+    Fallback encoder for types the stdlib json module does not support
+
+    Args:
+        obj: Object json.dumps could not serialize
+
+    Returns:
+        JSON serializable representation of obj
+    """
+    if isinstance(obj, S3ObjectInfo):
+        # Read the fields directly, dataclasses.asdict deep-copies every value
+        fields = {
+            'key': obj.key,
+            'size': obj.size,
+            'last_modified': obj.last_modified,
+            'etag': obj.etag,
+            'storage_class': obj.storage_class
+        }
+        if isinstance(obj, S3OwnedObjectInfo):
+            fields['owner'] = obj.owner
+        return fields
+    return str(obj)
+
+
+def utc_timestamp():
+    """
+    Current UTC time as an ISO 8601 string
+
+    Returns:
+        str: Timestamp with millisecond precision and a Z suffix
+    """
+    return datetime.now(_UTC).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
 def format_file_size(size_bytes):
     """
     Format file size in human readable format
@@ -241,20 +720,22 @@ def health_check():
     """
     try:
         # Test AWS credentials and S3 access
+        import boto3
+
         sts_client = boto3.client('sts')
         identity = sts_client.get_caller_identity()
 
         return {
             'status': 'healthy',
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': utc_timestamp(),
             'aws_account': identity.get('Account'),
             'aws_user_id': identity.get('UserId')
         }
     except Exception as e:
-        logger.error(f"Health check failed: {str(e)}")
+        logger.error("Health check failed: %s", e)
         return {
             'status': 'unhealthy',
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': utc_timestamp(),
             'error': str(e)
         }
 
@@ -281,6 +762,7 @@ if __name__ == "__main__":
 
     # Set environment variable for testing
     os.environ['BUCKET_NAME'] = 'test-bucket'
+    _refresh_config()
 
     result = lambda_handler(test_event, context)
     print(json.dumps(result, indent=2))
\ No newline at end of file
@@ -2,6 +2,9 @@ import json
 import pytest
 import os
 import boto3
+from moto import mock_s3
+
+import list_s3_contents
 
 
 class TestLambdaFunction:
@@ -12,11 +15,13 @@ class TestLambdaFunction:
         self.test_bucket = "test-bucket"
         os.environ['BUCKET_NAME'] = self.test_bucket
         os.environ['LOG_LEVEL'] = 'INFO'
+        list_s3_contents._refresh_config()
 
     def teardown_method(self):
         """Clean up after tests"""
         if 'BUCKET_NAME' in os.environ:
             del os.environ['BUCKET_NAME']
+        list_s3_contents._refresh_config()
 
     def test_environment_variables(self):
         """Test environment variable handling"""
@@ -57,6 +62,72 @@ class TestLambdaFunction:
         assert body['object_count'] == 2
         assert len(body['objects']) == 2
 
+    def test_dumps_json(self):
+        """Test JSON serialization helper used for response bodies"""
+        from datetime import datetime
+        from list_s3_contents import S3ObjectInfo, S3OwnedObjectInfo, dumps_json
+
+        body = dumps_json({
+            'bucket_name': self.test_bucket,
+            'objects': [
+                S3ObjectInfo('test1.txt', 100, 1704067200000, 'abc', 'STANDARD'),
+                S3OwnedObjectInfo('test2.txt', 200, 1704067200000, 'def', 'STANDARD',
+                                  {'id': 'owner-id', 'display_name': 'owner'})
+            ],
+            'timestamp': datetime(2024, 1, 1)
+        })
+
+        assert isinstance(body, str)
+        parsed = json.loads(body)
+        assert parsed['bucket_name'] == self.test_bucket
+        assert parsed['objects'][0] == {
+            'key': 'test1.txt',
+            'size': 100,
+            'last_modified': 1704067200000,
+            'etag': 'abc',
+            'storage_class': 'STANDARD'
+        }
+        assert parsed['objects'][1]['owner']['id'] == 'owner-id'
+        assert parsed['timestamp'].startswith('2024-01-01')
+
+    def test_listing_cache(self):
+        """Test warm container listing cache expiry and eviction"""
+        cache = list_s3_contents._CACHE
+        cache.clear()
+        key = (self.test_bucket, '', 100, False)
+
+        list_s3_contents._cache_put(key, 1, '{"object_count":1}')
+        assert list_s3_contents._cache_get(key) == (1, '{"object_count":1}')
+
+        # Expired entries are dropped on lookup
+        cache[key] = (0.0, 1, '{"object_count":1}')
+        assert list_s3_contents._cache_get(key) is None
+        assert key not in cache
+
+        # Oldest entries are evicted once the bodies exceed the byte limit
+        body = 'x' * (list_s3_contents.CACHE_MAX_BYTES // 4)
+        for i in range(5):
+            list_s3_contents._cache_put((self.test_bucket, str(i), 100, False), 0, body)
+        assert len(cache) == 4
+        assert (self.test_bucket, '0', 100, False) not in cache
+
+        # Bodies larger than the whole cache are not stored
+        list_s3_contents._cache_put(key, 0, 'x' * (list_s3_contents.CACHE_MAX_BYTES + 1))
+        assert key not in cache
+        cache.clear()
+
+    def test_format_file_size(self):
+        """Test human readable size formatting at unit boundaries"""
+        format_file_size = list_s3_contents.format_file_size
+
+        assert format_file_size(0) == '0.00 B'
+        assert format_file_size(1023) == '1023.00 B'
+        assert format_file_size(1024) == '1.00 KB'
+        assert format_file_size(1536) == '1.50 KB'
+        assert format_file_size(5 * 1024 ** 3) == '5.00 GB'
+        assert format_file_size(1024 ** 5) == '1.00 PB'
+        assert format_file_size(2048 * 1024 ** 5) == '2048.00 PB'
+
     def test_query_parameter_parsing(self):
         """Test query parameter parsing logic"""
         # Test valid parameters
@@ -134,6 +205,194 @@ class TestLambdaFunction:
         bucket_name = os.environ.get('BUCKET_NAME', 'default-bucket')
         assert bucket_name == 'default-bucket'
 
+        # Test that the handler reports the missing configuration
+        list_s3_contents._refresh_config()
+        response = list_s3_contents.lambda_handler({}, None)
+        assert response['statusCode'] == 500
+        assert json.loads(response['body'])['message'] == 'Bucket name not configured'
+
+
+class TestBucketListing:
+    """Test cases for bucket listing against a mocked S3 bucket"""
+
+    def setup_method(self):
+        """Start the S3 mock and create an empty test bucket"""
+        self.test_bucket = "test-bucket"
+        os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+        os.environ.setdefault('AWS_ACCESS_KEY_ID', 'testing')
+        os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'testing')
+
+        self.mock = mock_s3()
+        self.mock.start()
+        self.s3 = boto3.client('s3', region_name='us-east-1')
+        self.s3.create_bucket(Bucket=self.test_bucket)
+
+        # Make the function build its client inside the mock
+        os.environ['BUCKET_NAME'] = self.test_bucket
+        list_s3_contents._refresh_config()
+        list_s3_contents._s3_client = None
+        list_s3_contents._CACHE.clear()
+
+    def teardown_method(self):
+        """Stop the S3 mock and drop state shared with the function module"""
+        self.mock.stop()
+        del os.environ['BUCKET_NAME']
+        list_s3_contents._refresh_config()
+        list_s3_contents._s3_client = None
+        list_s3_contents._CACHE.clear()
+
+    def _put_objects(self, keys):
+        """Upload an empty object for each key"""
+        for key in keys:
+            self.s3.put_object(Bucket=self.test_bucket, Key=key, Body=b'')
+
+    def test_multi_page_listing(self):
+        """Test a max_keys limit spanning several S3 pages"""
+        keys = [f'file-{i:05d}.txt' for i in range(2500)]
+        self._put_objects(keys)
+
+        result = list_s3_contents.list_bucket_objects(self.test_bucket, max_keys=2100)
+
+        assert result['object_count'] == 2100
+        assert [obj.key for obj in result['objects']] == keys[:2100]
+
+        # Limits above the object count list everything without truncation
+        result = list_s3_contents.list_bucket_objects(self.test_bucket, max_keys=3000)
+
+        assert result['object_count'] == 2500
+        assert result['is_truncated'] is False
+        assert 'next_continuation_token' not in result
+
+    def test_truncated_listing_token(self):
+        """Test the truncation flag and that the token resumes the S3 listing"""
+        keys = [f'file-{i:05d}.txt' for i in range(1500)]
+        self._put_objects(keys)
+
+        result = list_s3_contents.list_bucket_objects(self.test_bucket, max_keys=1200)
+
+        assert result['is_truncated'] is True
+        resumed = self.s3.list_objects_v2(
+            Bucket=self.test_bucket,
+            ContinuationToken=result['next_continuation_token']
+        )
+        assert [obj['Key'] for obj in resumed['Contents']] == keys[1200:]
+
+    def test_json_listing_cache(self):
+        """Test JSON bodies are served from the cache while dict listings always list"""
+        self._put_objects(['a.txt', 'b.txt'])
+
+        body = list_s3_contents.list_bucket_objects_to_json(self.test_bucket)
+        assert json.loads(body)['object_count'] == 2
+
+        self.s3.delete_object(Bucket=self.test_bucket, Key='b.txt')
+        assert list_s3_contents.list_bucket_objects_to_json(self.test_bucket) == body
+        assert list_s3_contents.list_bucket_objects(self.test_bucket)['object_count'] == 1
+
+    def test_fetch_all_flat_bucket(self):
+        """Test fetch_all on a prefix without sub-prefixes falls back to plain paging"""
+        keys = [f'file-{i:05d}.txt' for i in range(1500)]
+        self._put_objects(keys)
+
+        result = list_s3_contents.list_bucket_objects(self.test_bucket, max_keys=1200, fetch_all=True)
+
+        assert [obj.key for obj in result['objects']] == keys[:1200]
+        assert result['is_truncated'] is True
+
+    def test_fetch_all_shard_merge_order(self):
+        """Test sharded listings merge direct objects and sub-prefixes in key order"""
+        keys = ['a.txt', 'b/1.txt', 'b/2.txt', 'c/d/1.txt', 'm.txt', 'n/1.txt', 'z.txt']
+        self._put_objects(reversed(keys))
+
+        result = list_s3_contents.list_bucket_objects(self.test_bucket, max_keys=100, fetch_all=True)
+
+        assert [obj.key for obj in result['objects']] == keys
+        assert result['is_truncated'] is False
+        assert 'common_prefixes' not in result
+
+    def test_fetch_all_truncated(self):
+        """Test sharded listings stop at max_keys and omit the continuation token"""
+        keys = [f'{shard}/{i}.txt' for shard in 'abc' for i in range(5)]
+        self._put_objects(keys)
+
+        result = list_s3_contents.list_bucket_objects(self.test_bucket, max_keys=7, fetch_all=True)
+
+        assert [obj.key for obj in result['objects']] == keys[:7]
+        assert result['is_truncated'] is True
+        assert 'next_continuation_token' not in result
+
+    def test_fetch_all_bounded_delimited_pass(self):
+        """Test the delimited pass of a sharded listing stops at max_keys entries"""
+        keys = ['a/1.txt', 'a/2.txt'] + [f'b{i}.txt' for i in range(5)] + ['c/1.txt']
+        self._put_objects(keys)
+
+        result = list_s3_contents.list_bucket_objects(self.test_bucket, max_keys=3, fetch_all=True)
+
+        assert [obj.key for obj in result['objects']] == keys[:3]
+        assert result['is_truncated'] is True
+
+
+    def test_handler_listing(self):
+        """Test a normal listing returns 200 with a JSON body and the default headers"""
+        self._put_objects(['a.txt', 'b.txt'])
+
+        response = list_s3_contents.lambda_handler({'queryStringParameters': None}, None)
+
+        assert response['statusCode'] == 200
+        assert response['headers'] == list_s3_contents.DEFAULT_HEADERS
+        body = json.loads(response['body'])
+        assert body['bucket_name'] == self.test_bucket
+        assert [obj['key'] for obj in body['objects']] == ['a.txt', 'b.txt']
+
+    def test_handler_missing_bucket(self):
+        """Test a missing bucket maps to a 404 response"""
+        os.environ['BUCKET_NAME'] = 'missing-bucket'
+        list_s3_contents._refresh_config()
+
+        response = list_s3_contents.lambda_handler({}, None)
+
+        assert response['statusCode'] == 404
+        assert response['headers'] == list_s3_contents.DEFAULT_HEADERS
+        assert json.loads(response['body'])['error'] == 'Bucket not found'
+
+    def test_handler_unmapped_client_error(self):
+        """Test an error code without a mapping falls back to the default 500 response"""
+        from botocore.exceptions import ClientError
+
+        def slow_down(params, **kwargs):
+            raise ClientError({'Error': {'Code': 'SlowDown', 'Message': 'Reduce your request rate'}},
+                              'ListObjectsV2')
+
+        list_s3_contents._get_s3().meta.events.register(
+            'provide-client-params.s3.ListObjectsV2', slow_down)
+
+        response = list_s3_contents.lambda_handler({}, None)
+
+        assert response['statusCode'] == 500
+        assert json.loads(response['body']) == {
+            'error': 'AWS service error',
+            'message': 'An error occurred while accessing AWS services'
+        }
+
+    def test_fetch_all_shard_error(self, monkeypatch):
+        """Test a failing shard releases the waiting shards and maps to an error response"""
+        from botocore.exceptions import ClientError
+
+        self._put_objects(f'{shard}/{i:02d}.txt' for shard in 'abc' for i in range(50))
+
+        def deny_shard_a(params, **kwargs):
+            if params.get('Prefix') == 'a/':
+                raise ClientError({'Error': {'Code': 'AccessDenied', 'Message': 'Denied'}}, 'ListObjectsV2')
+
+        # A small budget keeps the first pages short, so shards b and c wait for their turn
+        monkeypatch.setattr(list_s3_contents, 'MAX_TOTAL_KEYS', 320)
+        list_s3_contents._get_s3().meta.events.register(
+            'provide-client-params.s3.ListObjectsV2', deny_shard_a)
+
+        response = list_s3_contents.lambda_handler({'queryStringParameters': {'fetch_all': 'true'}}, None)
+
+        assert response['statusCode'] == 403
+        assert json.loads(response['body'])['error'] == 'Access denied'
+
 
 if __name__ == '__main__':
     # Run tests when script is executed directly
@@ -103,6 +103,7 @@ resource "aws_lambda_function" "s3_list_function" {
     variables = {
       BUCKET_NAME = aws_s3_bucket.app_bucket.id
       LOG_LEVEL   = var.log_level
+      CACHE_TTL   = var.lambda_cache_ttl_seconds
     }
   }
 
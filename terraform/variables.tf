@@ -83,6 +83,17 @@ variable "cache_ttl_seconds" {
   default     = 300
 }
 
+variable "lambda_cache_ttl_seconds" {
+  description = "Lambda in-memory listing cache TTL in seconds (0 disables it)"
+  type        = number
+  default     = 30
+
+  validation {
+    condition     = var.lambda_cache_ttl_seconds >= 0
+    error_message = "Lambda cache TTL must be zero or a positive number of seconds."
+  }
+}
+
 variable "project_name" {
   description = "Name of the project"
   type        = string